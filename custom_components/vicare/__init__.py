@@ -3,10 +3,22 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import timedelta
 import logging
+import random
+import time
 
 from PyViCare.PyViCare import PyViCare
 from PyViCare.PyViCareDevice import Device
+from PyViCare.PyViCareUtils import (
+    PyViCareInternalServerError,
+    PyViCareInvalidDataError,
+    PyViCareNotSupportedFeatureError,
+    PyViCareRateLimitError,
+)
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import voluptuous as vol
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
@@ -19,7 +31,10 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
 
 from .const import (
     CONF_CIRCUIT,
@@ -27,9 +42,12 @@ from .const import (
     DEFAULT_HEATING_TYPE,
     DOMAIN,
     HEATING_TYPE_TO_CREATOR_METHOD,
+    MAX_CONNECTION_BACKOFF,
+    MAX_RATE_LIMIT_BACKOFF,
     PLATFORMS,
     VICARE_API,
     VICARE_CIRCUITS,
+    VICARE_COORDINATOR,
     VICARE_DEVICE_CONFIG,
     HeatingType,
 )
@@ -44,6 +62,16 @@ class ViCareRequiredKeysMixin:
     value_getter: Callable[[Device], bool]
 
 
+def vicare_device_info(device_config) -> DeviceInfo:
+    """Return the device info of a ViCare device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_config.getConfig().serial)},
+        name=device_config.getModel(),
+        manufacturer="Viessmann",
+        model=device_config.getModel(),
+    )
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -97,11 +125,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.async_add_executor_job(setup_vicare_api, hass, entry)
 
+    coordinator = ViCareDataUpdateCoordinator(
+        hass,
+        hass.data[DOMAIN][entry.entry_id][VICARE_API],
+        hass.data[DOMAIN][entry.entry_id][VICARE_CIRCUITS],
+        entry.options.get(CONF_SCAN_INTERVAL, entry.data[CONF_SCAN_INTERVAL]),
+    )
+    await coordinator.async_config_entry_first_refresh()
+    hass.data[DOMAIN][entry.entry_id][VICARE_COORDINATOR] = coordinator
+
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload ViCare config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 def vicare_login(hass, entry_data):
     """Login via PyVicare API."""
     vicare_api = PyViCare()
@@ -115,9 +159,36 @@ def vicare_login(hass, entry_data):
     return vicare_api
 
 
+def _mount_retry_adapter(oauth_manager):
+    """Retry connection problems and gateway errors on the ViCare sessions."""
+    # Rate limiting (429) is handled by the coordinator itself and it backs off
+    # on its own, so do not wait for a Retry-After announced by the server.
+    adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+    )
+    oauth_manager.oauth_session.mount("https://", adapter)
+
+    # PyViCare replaces its session when renewing the token, mount the adapter
+    # on the new one before it is used
+    replace_session = oauth_manager.replace_session
+
+    def _replace_session(new_session):
+        new_session.mount("https://", adapter)
+        replace_session(new_session)
+
+    oauth_manager.replace_session = _replace_session
+
+
 def setup_vicare_api(hass, entry):
     """Set up PyVicare API."""
-    vicare_api = vicare_login(hass, entry.data)
+    vicare_api = vicare_login(hass, {**entry.data, **entry.options})
+    _mount_retry_adapter(vicare_api.oauth_manager)
 
     for device in vicare_api.devices:
         _LOGGER.info(
@@ -136,6 +207,140 @@ def setup_vicare_api(hass, entry):
     ][VICARE_API].circuits
 
 
+def _safe(getter, default=None):
+    """Return the value of a PyViCare getter or default if it is not supported."""
+    try:
+        return getter()
+    except PyViCareNotSupportedFeatureError:
+        return default
+
+
+class ViCareDataUpdateCoordinator(DataUpdateCoordinator):
+    """Fetch the state of all heating circuits and DHW once per update interval."""
+
+    def __init__(self, hass: HomeAssistant, api, circuits, scan_interval) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=scan_interval),
+        )
+        self._api = api
+        self._circuits = circuits
+        self._base_update_interval = timedelta(seconds=scan_interval)
+        self._consecutive_failures = 0
+        self._blocked_until = 0.0
+        self._rate_limit_backoff = scan_interval
+        self._modes = {}
+
+    async def _async_update_data(self):
+        """Fetch data from the ViCare API."""
+        if self.data is not None and self.blocked:
+            # Keep serving the last data until the rate limit is lifted
+            return self.data
+
+        try:
+            data = await self.hass.async_add_executor_job(self._poll)
+        except requests.exceptions.ConnectionError as err:
+            self._slow_down()
+            raise UpdateFailed("Unable to retrieve data from ViCare server") from err
+        except PyViCareInternalServerError as err:
+            self._slow_down()
+            raise UpdateFailed(err.message) from err
+        except PyViCareRateLimitError as err:
+            retry_after = self._rate_limit_retry_after(err)
+            self._blocked_until = time.monotonic() + retry_after
+            if self.data is None:
+                raise UpdateFailed(err.message) from err
+            _LOGGER.warning(
+                "%s Pausing updates for %d seconds", err.message, retry_after
+            )
+            return self.data
+        except ValueError as err:
+            raise UpdateFailed("Unable to decode data from ViCare server") from err
+        except PyViCareInvalidDataError as err:
+            raise UpdateFailed(f"Invalid data from Vicare server: {err}") from err
+
+        self._consecutive_failures = 0
+        self.update_interval = self._base_update_interval
+        self._rate_limit_backoff = self._base_update_interval.total_seconds()
+        return data
+
+    def modes(self, circuit_id):
+        """Return the ViCare modes supported by a circuit."""
+        return self._modes.get(circuit_id, ())
+
+    @property
+    def blocked(self):
+        """Return True while updates are paused after hitting the rate limit."""
+        return time.monotonic() < self._blocked_until
+
+    def _slow_down(self):
+        """Poll less often while the server cannot be reached or fails."""
+        self._consecutive_failures += 1
+        self.update_interval = min(
+            self._base_update_interval * 2**self._consecutive_failures,
+            timedelta(seconds=MAX_CONNECTION_BACKOFF),
+        )
+
+    def _rate_limit_retry_after(self, err):
+        """Return the number of seconds to wait after hitting the rate limit.
+
+        Waits until the limit reset announced by the API, but at least for an
+        exponentially growing backoff, and adds some jitter on top.
+        """
+        retry_after = self._rate_limit_backoff
+        if (limit_reset := getattr(err, "limitResetDate", None)) is not None:
+            reset_in = limit_reset.replace(tzinfo=dt_util.UTC) - dt_util.utcnow()
+            retry_after = max(retry_after, reset_in.total_seconds())
+
+        self._rate_limit_backoff = min(
+            self._rate_limit_backoff * 2, MAX_RATE_LIMIT_BACKOFF
+        )
+        return retry_after + random.uniform(0, retry_after * 0.1)
+
+    def _poll(self):
+        """Read circuit, DHW, burner and compressor state from the ViCare API."""
+        # Fetch all features with a single request per update. The getters and
+        # the sensor entities then read the cached response of PyViCare's
+        # service until the next update.
+        self._api.service.clear_cache()
+
+        data = {}
+        for circuit in self._circuits:
+            # The modes supported by a circuit do not change, only read them
+            # until the API returned some
+            if not self._modes.get(circuit.id):
+                self._modes[circuit.id] = tuple(_safe(circuit.getModes) or ())
+            data[circuit.id] = {
+                "room_temp": _safe(circuit.getRoomTemperature),
+                "supply_temp": _safe(circuit.getSupplyTemperature),
+                "program": _safe(circuit.getActiveProgram),
+                "desired_temp": _safe(circuit.getCurrentDesiredTemperature),
+                "mode": _safe(circuit.getActiveMode),
+                "slope": _safe(circuit.getHeatingCurveSlope),
+                "shift": _safe(circuit.getHeatingCurveShift),
+                "target_supply": _safe(circuit.getTargetSupplyTemperature),
+                "circulation_pump_active": _safe(circuit.getCirculationPumpActive),
+            }
+
+        data["dhw"] = {
+            "storage_temp": _safe(self._api.getDomesticHotWaterStorageTemperature),
+            "desired_temp": _safe(self._api.getDomesticHotWaterDesiredTemperature),
+            "charging_active": _safe(self._api.getDomesticHotWaterChargingActive),
+        }
+        data["burner_active"] = _safe(
+            lambda: any(burner.getActive() for burner in self._api.burners), False
+        )
+        data["compressor_active"] = _safe(
+            lambda: any(compressor.getActive() for compressor in self._api.compressors),
+            False,
+        )
+
+        return data
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload ViCare config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -1,6 +1,7 @@
 """Viessmann ViCare sensor device."""
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
@@ -19,8 +20,14 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.const import CONF_NAME
 
-from . import ViCareRequiredKeysMixin
-from .const import DOMAIN, VICARE_API, VICARE_CIRCUITS, VICARE_DEVICE_CONFIG
+from . import ViCareRequiredKeysMixin, vicare_device_info
+from .const import (
+    DOMAIN,
+    VICARE_API,
+    VICARE_CIRCUITS,
+    VICARE_COORDINATOR,
+    VICARE_DEVICE_CONFIG,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,7 +101,7 @@ COMPRESSOR_SENSORS: tuple[ViCareBinarySensorEntityDescription, ...] = (
 )
 
 
-def _build_entity(name, vicare_api, device_config, sensor):
+def _build_entity(name, coordinator, vicare_api, device_config, sensor):
     """Create a ViCare binary sensor entity."""
     try:
         sensor.value_getter(vicare_api)
@@ -108,6 +115,7 @@ def _build_entity(name, vicare_api, device_config, sensor):
 
     return ViCareBinarySensor(
         name,
+        coordinator,
         vicare_api,
         device_config,
         sensor,
@@ -118,20 +126,31 @@ async def _entities_from_descriptions(
     hass, name, all_devices, sensor_descriptions, iterables, config_entry
 ):
     """Create entities from descriptions and list of burners/circuits."""
-    for description in sensor_descriptions:
-        for current in iterables:
-            suffix = ""
-            if len(iterables) > 1:
-                suffix = f" {current.id}"
-            entity = await hass.async_add_executor_job(
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data[VICARE_COORDINATOR]
+    device_config = entry_data[VICARE_DEVICE_CONFIG]
+    entities = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(
                 _build_entity,
-                f"{name} {description.name}{suffix}",
+                f"{name} {description.name}{_suffix(current, iterables)}",
+                coordinator,
                 current,
-                hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
+                device_config,
                 description,
             )
-            if entity is not None:
-                all_devices.append(entity)
+            for description in sensor_descriptions
+            for current in iterables
+        )
+    )
+    all_devices.extend(entity for entity in entities if entity is not None)
+
+
+def _suffix(current, iterables):
+    """Return the name suffix distinguishing multiple burners/circuits."""
+    if len(iterables) > 1:
+        return f" {current.id}"
+    return ""
 
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
@@ -141,30 +160,19 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
 
     all_devices = []
 
-    for description in GLOBAL_SENSORS:
-        entity = _build_entity(
-            f"{name} {description.name}",
-            api,
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-            description,
-        )
-        if entity is not None:
-            all_devices.append(entity)
-            
-    for description in CIRCUIT_SENSORS:
-        for circuit in hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]:
-            suffix = ""
-            if len(hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]) > 1:
-                suffix = f" {circuit.id}"
-            entity = await hass.async_add_executor_job(
-                _build_entity,
-                f"{name} {description.name}{suffix}",
-                circuit,
-                hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-                description,
-            )
-            if entity is not None:
-                all_devices.append(entity)
+    await asyncio.gather(
+        _entities_from_descriptions(
+            hass, name, all_devices, GLOBAL_SENSORS, [api], config_entry
+        ),
+        _entities_from_descriptions(
+            hass,
+            name,
+            all_devices,
+            CIRCUIT_SENSORS,
+            hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS],
+            config_entry,
+        ),
+    )
 
     try:
         await _entities_from_descriptions(
@@ -189,25 +197,22 @@ class ViCareBinarySensor(BinarySensorEntity):
     entity_description: ViCareBinarySensorEntityDescription
 
     def __init__(
-        self, name, api, device_config, description: ViCareBinarySensorEntityDescription
+        self,
+        name,
+        coordinator,
+        api,
+        device_config,
+        description: ViCareBinarySensorEntityDescription,
     ):
         """Initialize the sensor."""
         self.entity_description = description
         self._attr_name = name
+        self._coordinator = coordinator
         self._api = api
         self.entity_description = description
         self._device_config = device_config
         self._state = None
-
-    @property
-    def device_info(self):
-        """Return device info for this device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_config.getConfig().serial)},
-            "name": self._device_config.getModel(),
-            "manufacturer": "Viessmann",
-            "model": (DOMAIN, self._device_config.getModel()),
-        }
+        self._attr_device_info = vicare_device_info(device_config)
 
     @property
     def available(self):
@@ -231,6 +236,9 @@ class ViCareBinarySensor(BinarySensorEntity):
 
     def update(self):
         """Update state of sensor."""
+        if self._coordinator.blocked:
+            # Do not hit the rate limit again before it is lifted
+            return
         try:
             with suppress(PyViCareNotSupportedFeatureError):
                 self._state = self.entity_description.value_getter(self._api)
@@ -239,6 +247,6 @@ class ViCareBinarySensor(BinarySensorEntity):
         except ValueError:
             _LOGGER.error("Unable to decode data from ViCare server")
         except PyViCareRateLimitError as limit_exception:
-            _LOGGER.error("Vicare API rate limit exceeded: %s", limit_exception)
+            _LOGGER.warning("%s", limit_exception.message)
         except PyViCareInvalidDataError as invalid_data_exception:
             _LOGGER.error("Invalid data from Vicare server: %s", invalid_data_exception)
@@ -1,13 +1,7 @@
 """Viessmann ViCare climate device."""
-from contextlib import suppress
 import logging
 
-from PyViCare.PyViCareUtils import (
-    PyViCareInvalidDataError,
-    PyViCareNotSupportedFeatureError,
-    PyViCareRateLimitError,
-)
-import requests
+from PyViCare.PyViCareUtils import PyViCareCommandError
 import voluptuous as vol
 
 from homeassistant.components.climate import ClimateEntity
@@ -28,14 +22,16 @@ from homeassistant.const import (
     PRECISION_WHOLE,
     TEMP_CELSIUS,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import vicare_device_info
 from .const import (
-    CONF_HEATING_TYPE,
     DOMAIN,
-    VICARE_API,
     VICARE_CIRCUITS,
+    VICARE_COORDINATOR,
     VICARE_DEVICE_CONFIG,
 )
 
@@ -44,6 +40,8 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_SET_VICARE_MODE = "set_vicare_mode"
 SERVICE_SET_VICARE_MODE_ATTR_MODE = "vicare_mode"
 
+SET_VICARE_MODE_SCHEMA = {vol.Required(SERVICE_SET_VICARE_MODE_ATTR_MODE): cv.string}
+
 VICARE_MODE_DHW = "dhw"
 VICARE_MODE_HEATING = "heating"
 VICARE_MODE_DHWANDHEATING = "dhwAndHeating"
@@ -96,180 +94,126 @@ HA_TO_VICARE_PRESET_HEATING = {
     PRESET_ECO: VICARE_PROGRAM_ECO,
 }
 
+HVAC_MODES = tuple(HA_TO_VICARE_HVAC_HEATING)
+PRESET_MODES = tuple(VICARE_TO_HA_PRESET_HEATING)
 
-def _build_entity(name, vicare_api, circuit, device_config, heating_type):
+
+def _build_entity(name, coordinator, circuit, device_config):
     """Create a ViCare climate entity."""
     _LOGGER.debug("Found device %s", name)
-    return ViCareClimate(name, vicare_api, device_config, circuit, heating_type)
+    return ViCareClimate(name, coordinator, circuit, device_config)
 
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up the ViCare climate platform."""
     name = config_entry.data[CONF_NAME]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    circuits = entry_data[VICARE_CIRCUITS]
+    coordinator = entry_data[VICARE_COORDINATOR]
+    device_config = entry_data[VICARE_DEVICE_CONFIG]
+    multiple_circuits = len(circuits) > 1
 
     all_devices = []
 
-    for circuit in hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]:
-        suffix = ""
-        if len(hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]) > 1:
-            suffix = f" {circuit.id}"
-        entity = _build_entity(
-            f"{name} Heating{suffix}",
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_API],
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-            circuit,
-            config_entry.data[CONF_HEATING_TYPE],
+    for circuit in circuits:
+        suffix = f" {circuit.id}" if multiple_circuits else ""
+        all_devices.append(
+            _build_entity(
+                f"{name} Heating{suffix}",
+                coordinator,
+                circuit,
+                device_config,
+            )
         )
-        if entity is not None:
-            all_devices.append(entity)
 
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
         SERVICE_SET_VICARE_MODE,
-        {vol.Required(SERVICE_SET_VICARE_MODE_ATTR_MODE): cv.string},
-        "set_vicare_mode",
+        SET_VICARE_MODE_SCHEMA,
+        "async_set_vicare_mode",
     )
 
     async_add_devices(all_devices)
 
 
-class ViCareClimate(ClimateEntity):
+class ViCareClimate(CoordinatorEntity, ClimateEntity):
     """Representation of the ViCare heating climate device."""
 
-    def __init__(self, name, api, circuit, device_config, heating_type):
-        """Initialize the climate device."""
-        self._name = name
-        self._state = None
-        self._api = api
-        self._circuit = circuit
-        self._device_config = device_config
-        self._attributes = {}
-        self._target_temperature = None
-        self._current_mode = None
-        self._current_temperature = None
-        self._current_program = None
-        self._heating_type = heating_type
-        self._current_action = None
+    # Only the attributes owned by this class; the _attr_* defaults of the
+    # Home Assistant base classes must stay regular class attributes.
+    __slots__ = ("_attributes", "_circuit")
 
-    @property
-    def unique_id(self):
-        """Return unique ID for this device."""
-        return f"{self._device_config.getConfig().serial}-{self._circuit.id}"
+    _attr_supported_features = SUPPORT_FLAGS_HEATING
+    _attr_temperature_unit = TEMP_CELSIUS
+    _attr_precision = PRECISION_WHOLE
+    _attr_min_temp = VICARE_TEMP_HEATING_MIN
+    _attr_max_temp = VICARE_TEMP_HEATING_MAX
+    _attr_hvac_modes = HVAC_MODES
+    _attr_preset_modes = PRESET_MODES
 
-    @property
-    def device_info(self):
-        """Return device info for this device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_config.getConfig().serial)},
-            "name": self._device_config.getModel(),
-            "manufacturer": "Viessmann",
-            "model": (DOMAIN, self._device_config.getModel()),
+    def __init__(self, name, coordinator, circuit, device_config):
+        """Initialize the climate device."""
+        super().__init__(coordinator)
+        self._attr_name = name
+        self._circuit = circuit
+        self._attr_unique_id = f"{device_config.getConfig().serial}-{circuit.id}"
+        self._attr_device_info = vicare_device_info(device_config)
+        self._attributes = {
+            "room_temperature": None,
+            "active_vicare_program": None,
+            "active_vicare_mode": None,
+            "heating_curve_slope": None,
+            "heating_curve_shift": None,
+            "target_supply_temperature": None,
+            "vicare_modes": (),
         }
-
-    def update(self):
-        """Let HA know there has been an update from the ViCare API."""
-        try:
-            _room_temperature = None
-            with suppress(PyViCareNotSupportedFeatureError):
-                _room_temperature = self._circuit.getRoomTemperature()
-
-            _supply_temperature = None
-            with suppress(PyViCareNotSupportedFeatureError):
-                _supply_temperature = self._circuit.getSupplyTemperature()
-
-            if _room_temperature is not None:
-                self._current_temperature = _room_temperature
-            elif _supply_temperature is not None:
-                self._current_temperature = _supply_temperature
-            else:
-                self._current_temperature = None
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._current_program = self._circuit.getActiveProgram()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._target_temperature = self._circuit.getCurrentDesiredTemperature()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._current_mode = self._circuit.getActiveMode()
-
-            # Update the generic device attributes
-            self._attributes = {}
-
-            self._attributes["room_temperature"] = _room_temperature
-            self._attributes["active_vicare_program"] = self._current_program
-            self._attributes["active_vicare_mode"] = self._current_mode
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._attributes[
-                    "heating_curve_slope"
-                ] = self._circuit.getHeatingCurveSlope()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._attributes[
-                    "heating_curve_shift"
-                ] = self._circuit.getHeatingCurveShift()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._attributes[
-                    "target_supply_temperature"
-                ] = self._circuit.getTargetSupplyTemperature()
-
-            self._attributes["vicare_modes"] = self._circuit.getModes()
-
-            self._current_action = False
-            # Update the specific device attributes
-            with suppress(PyViCareNotSupportedFeatureError):
-                for burner in self._api.burners:
-                    self._current_action = self._current_action or burner.getActive()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                for compressor in self._api.compressors:
-                    self._current_action = (
-                        self._current_action or compressor.getActive()
-                    )
-
-        except requests.exceptions.ConnectionError:
-            _LOGGER.error("Unable to retrieve data from ViCare server")
-        except PyViCareRateLimitError as limit_exception:
-            _LOGGER.error("Vicare API rate limit exceeded: %s", limit_exception)
-        except ValueError:
-            _LOGGER.error("Unable to decode data from ViCare server")
-        except PyViCareInvalidDataError as invalid_data_exception:
-            _LOGGER.error("Invalid data from Vicare server: %s", invalid_data_exception)
-
-    @property
-    def supported_features(self):
-        """Return the list of supported features."""
-        return SUPPORT_FLAGS_HEATING
-
-    @property
-    def name(self):
-        """Return the name of the climate device."""
-        return self._name
+        self._update_attributes()
 
     @property
-    def temperature_unit(self):
-        """Return the unit of measurement."""
-        return TEMP_CELSIUS
+    def _circuit_data(self):
+        """Return the coordinator data of this circuit."""
+        return self.coordinator.data[self._circuit.id]
+
+    def _update_attributes(self):
+        """Update the entity attributes from the coordinator data."""
+        circuit_data = self._circuit_data
+        self._attr_hvac_mode = VICARE_TO_HA_HVAC_HEATING.get(circuit_data["mode"])
+        self._attr_preset_mode = VICARE_TO_HA_PRESET_HEATING.get(circuit_data["program"])
+        self._attributes["room_temperature"] = circuit_data["room_temp"]
+        self._attributes["active_vicare_program"] = circuit_data["program"]
+        self._attributes["active_vicare_mode"] = circuit_data["mode"]
+        self._attributes["heating_curve_slope"] = circuit_data["slope"]
+        self._attributes["heating_curve_shift"] = circuit_data["shift"]
+        self._attributes["target_supply_temperature"] = circuit_data["target_supply"]
+        self._attributes["vicare_modes"] = self.coordinator.modes(self._circuit.id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attributes()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_set_circuit_data(self, key, value):
+        """Keep a value written to the ViCare API until the next update."""
+        self._circuit_data[key] = value
+        # Other entities read the same circuit data
+        self.coordinator.async_set_updated_data(self.coordinator.data)
 
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return self._current_temperature
+        if self._circuit_data["room_temp"] is not None:
+            return self._circuit_data["room_temp"]
+        return self._circuit_data["supply_temp"]
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        return self._target_temperature
-
-    @property
-    def hvac_mode(self):
-        """Return current hvac mode."""
-        return VICARE_TO_HA_HVAC_HEATING.get(self._current_mode)
+        return self._circuit_data["desired_temp"]
 
-    def set_hvac_mode(self, hvac_mode):
+    async def async_set_hvac_mode(self, hvac_mode):
         """Set a new hvac mode on the ViCare API."""
         vicare_mode = HA_TO_VICARE_HVAC_HEATING.get(hvac_mode)
         if vicare_mode is None:
@@ -278,52 +222,28 @@ class ViCareClimate(ClimateEntity):
             )
 
         _LOGGER.debug("Setting hvac mode to %s / %s", hvac_mode, vicare_mode)
-        self._circuit.setMode(vicare_mode)
-
-    @property
-    def hvac_modes(self):
-        """Return the list of available hvac modes."""
-        return list(HA_TO_VICARE_HVAC_HEATING)
+        await self.hass.async_add_executor_job(self._circuit.setMode, vicare_mode)
+        self._async_set_circuit_data("mode", vicare_mode)
 
     @property
     def hvac_action(self):
         """Return the current hvac action."""
-        if self._current_action:
+        if (
+            self.coordinator.data["burner_active"]
+            or self.coordinator.data["compressor_active"]
+        ):
             return CURRENT_HVAC_HEAT
         return CURRENT_HVAC_IDLE
 
-    @property
-    def min_temp(self):
-        """Return the minimum temperature."""
-        return VICARE_TEMP_HEATING_MIN
-
-    @property
-    def max_temp(self):
-        """Return the maximum temperature."""
-        return VICARE_TEMP_HEATING_MAX
-
-    @property
-    def precision(self):
-        """Return the precision of the system."""
-        return PRECISION_WHOLE
-
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         """Set new target temperatures."""
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            self._circuit.setProgramTemperature(self._current_program, temp)
-            self._target_temperature = temp
-
-    @property
-    def preset_mode(self):
-        """Return the current preset mode, e.g., home, away, temp."""
-        return VICARE_TO_HA_PRESET_HEATING.get(self._current_program)
-
-    @property
-    def preset_modes(self):
-        """Return the available preset mode."""
-        return list(VICARE_TO_HA_PRESET_HEATING)
+            await self.hass.async_add_executor_job(
+                self._circuit.setProgramTemperature, self._circuit_data["program"], temp
+            )
+            self._async_set_circuit_data("desired_temp", temp)
 
-    def set_preset_mode(self, preset_mode):
+    async def async_set_preset_mode(self, preset_mode):
         """Set new preset mode and deactivate any existing programs."""
         vicare_program = HA_TO_VICARE_PRESET_HEATING.get(preset_mode)
         if vicare_program is None:
@@ -331,18 +251,38 @@ class ViCareClimate(ClimateEntity):
                 f"Cannot set invalid vicare program: {preset_mode}/{vicare_program}"
             )
 
+        current_program = self._circuit_data["program"]
+        if vicare_program == current_program:
+            return
+
         _LOGGER.debug("Setting preset to %s / %s", preset_mode, vicare_program)
-        self._circuit.deactivateProgram(self._current_program)
-        self._circuit.activateProgram(vicare_program)
+        if current_program not in (
+            None,
+            VICARE_PROGRAM_NORMAL,
+            VICARE_PROGRAM_STANDBY,
+        ):
+            try:
+                await self.hass.async_add_executor_job(
+                    self._circuit.deactivateProgram, current_program
+                )
+            except PyViCareCommandError as command_error:
+                _LOGGER.debug(
+                    "Unable to deactivate program %s: %s", current_program, command_error
+                )
+        await self.hass.async_add_executor_job(
+            self._circuit.activateProgram, vicare_program
+        )
+        self._async_set_circuit_data("program", vicare_program)
 
     @property
     def extra_state_attributes(self):
         """Show Device Attributes."""
         return self._attributes
 
-    def set_vicare_mode(self, vicare_mode):
+    async def async_set_vicare_mode(self, vicare_mode):
         """Service function to set vicare modes directly."""
-        if vicare_mode not in self._attributes["vicare_modes"]:
+        if vicare_mode not in self.coordinator.modes(self._circuit.id):
             raise ValueError(f"Cannot set invalid vicare mode: {vicare_mode}.")
 
-        self._circuit.setMode(vicare_mode)
+        await self.hass.async_add_executor_job(self._circuit.setMode, vicare_mode)
+        self._async_set_circuit_data("mode", vicare_mode)
@@ -21,11 +21,14 @@ PLATFORMS = [
 VICARE_DEVICE_CONFIG = "device_conf"
 VICARE_API = "api"
 VICARE_CIRCUITS = "circuits"
+VICARE_COORDINATOR = "coordinator"
 
 CONF_CIRCUIT = "circuit"
 CONF_HEATING_TYPE = "heating_type"
 
 DEFAULT_SCAN_INTERVAL = 60
+MAX_RATE_LIMIT_BACKOFF = 3600
+MAX_CONNECTION_BACKOFF = 1800
 
 VICARE_CUBIC_METER = "cubicMeter"
 VICARE_KWH = "kilowattHour"
@@ -1,6 +1,7 @@
 """Viessmann ViCare sensor device."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
@@ -34,11 +35,12 @@ from homeassistant.const import (
 )
 import homeassistant.util.dt as dt_util
 
-from . import ViCareRequiredKeysMixin
+from . import ViCareRequiredKeysMixin, vicare_device_info
 from .const import (
     DOMAIN,
     VICARE_API,
     VICARE_CIRCUITS,
+    VICARE_COORDINATOR,
     VICARE_DEVICE_CONFIG,
     VICARE_UNIT_TO_DEVICE_CLASS,
     VICARE_UNIT_TO_UNIT_OF_MEASUREMENT,
@@ -472,7 +474,7 @@ COMPRESSOR_SENSORS: tuple[ViCareSensorEntityDescription, ...] = (
 )
 
 
-def _build_entity(name, vicare_api, device_config, sensor):
+def _build_entity(name, coordinator, vicare_api, device_config, sensor):
     """Create a ViCare sensor entity."""
     _LOGGER.debug("Found device %s", name)
     try:
@@ -496,6 +498,7 @@ def _build_entity(name, vicare_api, device_config, sensor):
 
     return ViCareSensor(
         name,
+        coordinator,
         vicare_api,
         device_config,
         sensor,
@@ -506,20 +509,31 @@ async def _entities_from_descriptions(
     hass, name, all_devices, sensor_descriptions, iterables, config_entry
 ):
     """Create entities from descriptions and list of burners/circuits."""
-    for description in sensor_descriptions:
-        for current in iterables:
-            suffix = ""
-            if len(iterables) > 1:
-                suffix = f" {current.id}"
-            entity = await hass.async_add_executor_job(
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data[VICARE_COORDINATOR]
+    device_config = entry_data[VICARE_DEVICE_CONFIG]
+    entities = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(
                 _build_entity,
-                f"{name} {description.name}{suffix}",
+                f"{name} {description.name}{_suffix(current, iterables)}",
+                coordinator,
                 current,
-                hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
+                device_config,
                 description,
             )
-            if entity is not None:
-                all_devices.append(entity)
+            for description in sensor_descriptions
+            for current in iterables
+        )
+    )
+    all_devices.extend(entity for entity in entities if entity is not None)
+
+
+def _suffix(current, iterables):
+    """Return the name suffix distinguishing multiple burners/circuits."""
+    if len(iterables) > 1:
+        return f" {current.id}"
+    return ""
 
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
@@ -528,31 +542,20 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
     api = hass.data[DOMAIN][config_entry.entry_id][VICARE_API]
 
     all_devices = []
-    for description in GLOBAL_SENSORS:
-        entity = await hass.async_add_executor_job(
-            _build_entity,
-            f"{name} {description.name}",
-            api,
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-            description,
-        )
-        if entity is not None:
-            all_devices.append(entity)
-
-    for description in CIRCUIT_SENSORS:
-        for circuit in hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]:
-            suffix = ""
-            if len(hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]) > 1:
-                suffix = f" {circuit.id}"
-            entity = await hass.async_add_executor_job(
-                _build_entity,
-                f"{name} {description.name}{suffix}",
-                circuit,
-                hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-                description,
-            )
-            if entity is not None:
-                all_devices.append(entity)
+
+    await asyncio.gather(
+        _entities_from_descriptions(
+            hass, name, all_devices, GLOBAL_SENSORS, [api], config_entry
+        ),
+        _entities_from_descriptions(
+            hass,
+            name,
+            all_devices,
+            CIRCUIT_SENSORS,
+            hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS],
+            config_entry,
+        ),
+    )
 
     try:
         await _entities_from_descriptions(
@@ -577,26 +580,23 @@ class ViCareSensor(SensorEntity):
     entity_description: ViCareSensorEntityDescription
 
     def __init__(
-        self, name, api, device_config, description: ViCareSensorEntityDescription
+        self,
+        name,
+        coordinator,
+        api,
+        device_config,
+        description: ViCareSensorEntityDescription,
     ):
         """Initialize the sensor."""
         self.entity_description = description
         self._attr_name = name
+        self._coordinator = coordinator
         self._api = api
         self._device_config = device_config
         self._state = None
+        self._attr_device_info = vicare_device_info(device_config)
         self._last_reset = dt_util.utcnow()
 
-    @property
-    def device_info(self):
-        """Return device info for this device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_config.getConfig().serial)},
-            "name": self._device_config.getModel(),
-            "manufacturer": "Viessmann",
-            "model": (DOMAIN, self._device_config.getModel()),
-        }
-
     @property
     def available(self):
         """Return True if entity is available."""
@@ -624,6 +624,9 @@ class ViCareSensor(SensorEntity):
 
     def update(self):
         """Update state of sensor."""
+        if self._coordinator.blocked:
+            # Do not hit the rate limit again before it is lifted
+            return
         self._last_reset = dt_util.start_of_local_day()
         try:
             with suppress(PyViCareNotSupportedFeatureError):
@@ -633,6 +636,6 @@ class ViCareSensor(SensorEntity):
         except ValueError:
             _LOGGER.error("Unable to decode data from ViCare server")
         except PyViCareRateLimitError as limit_exception:
-            _LOGGER.error("Vicare API rate limit exceeded: %s", limit_exception)
+            _LOGGER.warning("%s", limit_exception.message)
         except PyViCareInvalidDataError as invalid_data_exception:
             _LOGGER.error("Invalid data from Vicare server: %s", invalid_data_exception)
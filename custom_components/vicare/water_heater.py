@@ -1,14 +1,6 @@
 """Viessmann ViCare water_heater device."""
-from contextlib import suppress
 import logging
 
-from PyViCare.PyViCareUtils import (
-    PyViCareInvalidDataError,
-    PyViCareNotSupportedFeatureError,
-    PyViCareRateLimitError,
-)
-import requests
-
 from homeassistant.components.water_heater import (
     SUPPORT_TARGET_TEMPERATURE,
     WaterHeaterEntity,
@@ -21,12 +13,14 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.helpers import entity_platform
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import vicare_device_info
 from .const import (
-    CONF_HEATING_TYPE,
     DOMAIN,
     VICARE_API,
     VICARE_CIRCUITS,
+    VICARE_COORDINATOR,
     VICARE_DEVICE_CONFIG,
 )
 
@@ -34,6 +28,8 @@ _LOGGER = logging.getLogger(__name__)
 
 VICARE_SERVICE_ACTIVATE_ONETIMECHARGE = "activate_onetimecharge"
 
+ACTIVATE_ONETIMECHARGE_SCHEMA = {}
+
 VICARE_MODE_DHW = "dhw"
 VICARE_MODE_DHWANDHEATING = "dhwAndHeating"
 VICARE_MODE_FORCEDREDUCED = "forcedReduced"
@@ -61,37 +57,37 @@ HA_TO_VICARE_HVAC_DHW = {
     OPERATION_MODE_ON: VICARE_MODE_DHW,
 }
 
+OPERATION_LIST = tuple(HA_TO_VICARE_HVAC_DHW)
+
 
-def _build_entity(name, vicare_api, circuit, device_config, heating_type):
+def _build_entity(name, coordinator, vicare_api, circuit, device_config):
     """Create a ViCare water_heater entity."""
     _LOGGER.debug("Found device %s", name)
-    return ViCareWater(
-        name,
-        vicare_api,
-        circuit,
-        device_config,
-        heating_type,
-    )
+    return ViCareWater(name, coordinator, vicare_api, circuit, device_config)
 
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     """Set up the ViCare climate platform."""
     name = config_entry.data[CONF_NAME]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    circuits = entry_data[VICARE_CIRCUITS]
+    coordinator = entry_data[VICARE_COORDINATOR]
+    api = entry_data[VICARE_API]
+    device_config = entry_data[VICARE_DEVICE_CONFIG]
+    multiple_circuits = len(circuits) > 1
 
     all_devices = []
-    for circuit in hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]:
-        suffix = ""
-        if len(hass.data[DOMAIN][config_entry.entry_id][VICARE_CIRCUITS]) > 1:
-            suffix = f" {circuit.id}"
-        entity = _build_entity(
-            f"{name} Water{suffix}",
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_API],
-            circuit,
-            hass.data[DOMAIN][config_entry.entry_id][VICARE_DEVICE_CONFIG],
-            config_entry.data[CONF_HEATING_TYPE],
+    for circuit in circuits:
+        suffix = f" {circuit.id}" if multiple_circuits else ""
+        all_devices.append(
+            _build_entity(
+                f"{name} Water{suffix}",
+                coordinator,
+                api,
+                circuit,
+                device_config,
+            )
         )
-        if entity is not None:
-            all_devices.append(entity)
 
     async_add_devices(all_devices)
 
@@ -99,75 +95,30 @@ async def async_setup_entry(hass, config_entry, async_add_devices):
 
     platform.async_register_entity_service(
         VICARE_SERVICE_ACTIVATE_ONETIMECHARGE,
-        {
-        },
+        ACTIVATE_ONETIMECHARGE_SCHEMA,
         "activate_onetimecharge",
     )
 
 
-class ViCareWater(WaterHeaterEntity):
+class ViCareWater(CoordinatorEntity, WaterHeaterEntity):
     """Representation of the ViCare domestic hot water device."""
 
-    def __init__(self, name, api, circuit, device_config, heating_type):
+    _attr_operation_list = OPERATION_LIST
+
+    def __init__(self, name, coordinator, api, circuit, device_config):
         """Initialize the DHW water_heater device."""
+        super().__init__(coordinator)
         self._name = name
-        self._state = None
         self._api = api
         self._circuit = circuit
         self._device_config = device_config
-        self._attributes = {}
-        self._target_temperature = None
-        self._current_temperature = None
-        self._current_mode = None
-        self._heating_type = heating_type
-
-    def update(self):
-        """Let HA know there has been an update from the ViCare API."""
-        try:
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._current_temperature = (
-                    self._api.getDomesticHotWaterStorageTemperature()
-                )
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._target_temperature = (
-                    self._api.getDomesticHotWaterDesiredTemperature()
-                )
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._current_mode = self._circuit.getActiveMode()
-
-            self._attributes = {}
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._attributes["charging_active"] = self._api.getDomesticHotWaterChargingActive()
-
-            with suppress(PyViCareNotSupportedFeatureError):
-                self._attributes["circulation_pump_active"] = self._circuit.getCirculationPumpActive()
-
-        except requests.exceptions.ConnectionError:
-            _LOGGER.error("Unable to retrieve data from ViCare server")
-        except PyViCareRateLimitError as limit_exception:
-            _LOGGER.error("Vicare API rate limit exceeded: %s", limit_exception)
-        except ValueError:
-            _LOGGER.error("Unable to decode data from ViCare server")
-        except PyViCareInvalidDataError as invalid_data_exception:
-            _LOGGER.error("Invalid data from Vicare server: %s", invalid_data_exception)
+        self._attr_device_info = vicare_device_info(device_config)
 
     @property
     def unique_id(self):
         """Return unique ID for this device."""
         return f"{self._device_config.getConfig().serial}-{self._circuit.id}"
 
-    @property
-    def device_info(self):
-        """Return device info for this device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_config.getConfig().serial)},
-            "name": self._device_config.getModel(),
-            "manufacturer": "Viessmann",
-            "model": (DOMAIN, self._device_config.getModel()),
-        }
-
     @property
     def supported_features(self):
         """Return the list of supported features."""
@@ -186,18 +137,21 @@ class ViCareWater(WaterHeaterEntity):
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return self._current_temperature
+        return self.coordinator.data["dhw"]["storage_temp"]
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        return self._target_temperature
+        return self.coordinator.data["dhw"]["desired_temp"]
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         """Set new target temperatures."""
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            self._api.setDomesticHotWaterTemperature(temp)
-            self._target_temperature = temp
+            await self.hass.async_add_executor_job(
+                self._api.setDomesticHotWaterTemperature, temp
+            )
+            self.coordinator.data["dhw"]["desired_temp"] = temp
+            self.coordinator.async_set_updated_data(self.coordinator.data)
 
     @property
     def min_temp(self):
@@ -217,17 +171,19 @@ class ViCareWater(WaterHeaterEntity):
     @property
     def current_operation(self):
         """Return current operation ie. heat, cool, idle."""
-        return VICARE_TO_HA_HVAC_DHW.get(self._current_mode)
-
-    @property
-    def operation_list(self):
-        """Return the list of available operation modes."""
-        return list(HA_TO_VICARE_HVAC_DHW)
+        return VICARE_TO_HA_HVAC_DHW.get(
+            self.coordinator.data[self._circuit.id]["mode"]
+        )
 
     @property
     def extra_state_attributes(self):
         """Show Device Attributes."""
-        return self._attributes
+        return {
+            "charging_active": self.coordinator.data["dhw"]["charging_active"],
+            "circulation_pump_active": self.coordinator.data[self._circuit.id][
+                "circulation_pump_active"
+            ],
+        }
 
     def activate_onetimecharge(self):
         """Service function to activate one time hot water charge."""
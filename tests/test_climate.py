@@ -0,0 +1,90 @@
+"""Test the ViCare climate entity."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.components.climate.const import (
+    ATTR_PRESET_MODE,
+    HVAC_MODE_HEAT,
+    PRESET_ECO,
+)
+from homeassistant.components.vicare import ViCareDataUpdateCoordinator
+from homeassistant.components.vicare.climate import ViCareClimate
+from homeassistant.const import ATTR_TEMPERATURE
+
+ENTITY_ID = "climate.vicare_heating"
+
+
+@pytest.fixture
+async def climate(hass):
+    """Return a climate entity added to Home Assistant."""
+    circuit = MagicMock(id="0")
+    device_config = MagicMock()
+    device_config.getConfig.return_value.serial = "1234"
+    device_config.getModel.return_value = "Vitodens 200"
+
+    coordinator = ViCareDataUpdateCoordinator(hass, MagicMock(), [circuit], 60)
+    coordinator.data = {
+        circuit.id: {
+            "room_temp": 21,
+            "supply_temp": 35,
+            "program": "comfort",
+            "desired_temp": 21,
+            "mode": "dhwAndHeating",
+            "slope": 1.4,
+            "shift": 0,
+            "target_supply": 40,
+            "circulation_pump_active": True,
+        },
+        "dhw": {"storage_temp": 50, "desired_temp": 55, "charging_active": False},
+        "burner_active": True,
+        "compressor_active": False,
+    }
+    coordinator._modes = {circuit.id: ("dhw", "dhwAndHeating", "forcedNormal")}
+
+    climate = ViCareClimate("ViCare Heating", coordinator, circuit, device_config)
+    climate.hass = hass
+    climate.entity_id = ENTITY_ID
+    await climate.async_added_to_hass()
+    return climate
+
+
+async def test_set_hvac_mode(hass, climate):
+    """Test a new hvac mode is shown right after it was set."""
+    await climate.async_set_hvac_mode(HVAC_MODE_HEAT)
+
+    climate._circuit.setMode.assert_called_once_with("forcedNormal")
+    state = hass.states.get(ENTITY_ID)
+    assert state.state == HVAC_MODE_HEAT
+    assert state.attributes["active_vicare_mode"] == "forcedNormal"
+
+
+async def test_set_temperature(hass, climate):
+    """Test a new target temperature is shown right after it was set."""
+    await climate.async_set_temperature(**{ATTR_TEMPERATURE: 23})
+
+    climate._circuit.setProgramTemperature.assert_called_once_with("comfort", 23)
+    assert hass.states.get(ENTITY_ID).attributes[ATTR_TEMPERATURE] == 23
+
+
+async def test_set_preset_mode(hass, climate):
+    """Test a new preset is shown right after it was set."""
+    await climate.async_set_preset_mode(PRESET_ECO)
+
+    climate._circuit.deactivateProgram.assert_called_once_with("comfort")
+    climate._circuit.activateProgram.assert_called_once_with("eco")
+    state = hass.states.get(ENTITY_ID)
+    assert state.attributes[ATTR_PRESET_MODE] == PRESET_ECO
+    assert state.attributes["active_vicare_program"] == "eco"
+
+
+async def test_set_vicare_mode(hass, climate):
+    """Test only the modes supported by the circuit can be set."""
+    with pytest.raises(ValueError):
+        await climate.async_set_vicare_mode("heating")
+    climate._circuit.setMode.assert_not_called()
+
+    await climate.async_set_vicare_mode("dhw")
+
+    climate._circuit.setMode.assert_called_once_with("dhw")
+    assert hass.states.get(ENTITY_ID).attributes["active_vicare_mode"] == "dhw"
@@ -6,7 +6,12 @@ from PyViCare.PyViCareUtils import PyViCareInvalidCredentialsError
 from homeassistant import config_entries, data_entry_flow, setup
 from homeassistant.components import dhcp
 from homeassistant.components.vicare.const import DOMAIN
-from homeassistant.const import CONF_CLIENT_ID, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_CLIENT_ID,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_USERNAME,
+)
 
 from . import ENTRY_CONFIG, MOCK_MAC
 
@@ -200,3 +205,24 @@ async def test_user_input_single_instance_allowed(hass):
     )
     assert result["type"] == data_entry_flow.RESULT_TYPE_ABORT
     assert result["reason"] == "single_instance_allowed"
+
+
+async def test_options_flow(hass):
+    """Test that the scan interval can be changed via the options flow."""
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="ViCare",
+        data=ENTRY_CONFIG,
+    )
+    mock_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_entry.entry_id)
+    assert result["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result["step_id"] == "init"
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 300},
+    )
+    assert result2["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    assert mock_entry.options == {CONF_SCAN_INTERVAL: 300}
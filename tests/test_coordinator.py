@@ -0,0 +1,135 @@
+"""Test the ViCare data update coordinator."""
+from datetime import timedelta
+import time
+from unittest.mock import MagicMock, patch
+
+from PyViCare.PyViCareUtils import (
+    PyViCareInternalServerError,
+    PyViCareNotSupportedFeatureError,
+    PyViCareRateLimitError,
+)
+import pytest
+import requests
+
+from homeassistant.components.vicare import ViCareDataUpdateCoordinator
+from homeassistant.components.vicare.const import (
+    MAX_CONNECTION_BACKOFF,
+    MAX_RATE_LIMIT_BACKOFF,
+)
+
+SCAN_INTERVAL = 60
+MOCK_DATA = {"dhw": {"storage_temp": 50}, "burner_active": False}
+
+
+def _rate_limit_error(limit_reset=0):
+    """Return a rate limit error resetting at the given timestamp."""
+    return PyViCareRateLimitError(
+        {
+            "extendedPayload": {
+                "name": "ViCare day limit",
+                "requestCountLimit": 1450,
+                "limitReset": limit_reset * 1000,
+            }
+        }
+    )
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Return a coordinator which already holds data."""
+    coordinator = ViCareDataUpdateCoordinator(hass, MagicMock(), [], SCAN_INTERVAL)
+    coordinator.data = MOCK_DATA
+    return coordinator
+
+
+async def test_rate_limit_serves_last_data(coordinator):
+    """Test the last data is served while the rate limit is hit."""
+    with patch.object(
+        coordinator, "_poll", side_effect=_rate_limit_error()
+    ) as mock_poll:
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data == MOCK_DATA
+        assert coordinator.blocked
+
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data == MOCK_DATA
+
+    # The second refresh is skipped until the limit is lifted
+    assert mock_poll.call_count == 1
+
+
+async def test_rate_limit_backoff(coordinator):
+    """Test the rate limit backoff doubles up to its maximum."""
+    waits = []
+    with patch.object(coordinator, "_poll", side_effect=_rate_limit_error()), patch(
+        "homeassistant.components.vicare.random.uniform", return_value=0
+    ), patch("homeassistant.components.vicare.time") as mock_time:
+        mock_time.monotonic.return_value = 0
+        for _ in range(8):
+            await coordinator.async_refresh()
+            waits.append(coordinator._blocked_until)
+            coordinator._blocked_until = 0
+
+    assert waits == [60, 120, 240, 480, 960, 1920, 3600, 3600]
+    assert coordinator._rate_limit_backoff == MAX_RATE_LIMIT_BACKOFF
+    assert coordinator.data == MOCK_DATA
+
+
+async def test_rate_limit_reset_date(coordinator):
+    """Test a later limit reset announced by the API overrides the backoff."""
+    error = _rate_limit_error(time.time() + 7200)
+    with patch.object(coordinator, "_poll", side_effect=error), patch(
+        "homeassistant.components.vicare.random.uniform", return_value=0
+    ), patch("homeassistant.components.vicare.time") as mock_time:
+        mock_time.monotonic.return_value = 0
+        await coordinator.async_refresh()
+
+    assert coordinator._blocked_until == pytest.approx(7200, abs=5)
+    assert coordinator._rate_limit_backoff == 2 * SCAN_INTERVAL
+    assert coordinator.data == MOCK_DATA
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.exceptions.ConnectionError(),
+        PyViCareInternalServerError(
+            {"statusCode": 502, "message": "Bad Gateway", "viErrorId": "1234"}
+        ),
+    ],
+)
+async def test_connection_backoff(coordinator, error):
+    """Test polling slows down while the server fails and recovers after."""
+    with patch.object(coordinator, "_poll", side_effect=error):
+        for _ in range(6):
+            await coordinator.async_refresh()
+            assert not coordinator.last_update_success
+
+    assert coordinator.update_interval == timedelta(seconds=MAX_CONNECTION_BACKOFF)
+
+    with patch.object(coordinator, "_poll", return_value=MOCK_DATA):
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == coordinator._base_update_interval
+
+
+async def test_modes_read_until_supported(hass):
+    """Test the supported modes are read again until the API returns some."""
+    circuit = MagicMock(id="0")
+    circuit.getModes.side_effect = [
+        PyViCareNotSupportedFeatureError,
+        ["dhw", "dhwAndHeating"],
+    ]
+    coordinator = ViCareDataUpdateCoordinator(hass, MagicMock(), [circuit], 60)
+
+    await coordinator.async_refresh()
+    assert coordinator.modes(circuit.id) == ()
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.modes(circuit.id) == ("dhw", "dhwAndHeating")
+    assert circuit.getModes.call_count == 2
+    assert "modes" not in coordinator.data[circuit.id]
@@ -0,0 +1,37 @@
+"""Test the ViCare sensor entities."""
+import time
+from unittest.mock import MagicMock
+
+from homeassistant.components.vicare import ViCareDataUpdateCoordinator
+from homeassistant.components.vicare.sensor import (
+    ViCareSensor,
+    ViCareSensorEntityDescription,
+)
+
+
+async def test_update_skipped_while_blocked(hass):
+    """Test sensors do not poll the API while the rate limit is hit."""
+    api = MagicMock()
+    coordinator = ViCareDataUpdateCoordinator(hass, api, [], 60)
+    value_getter = MagicMock(return_value=12.5)
+    sensor = ViCareSensor(
+        "ViCare Outside Temperature",
+        coordinator,
+        api,
+        MagicMock(),
+        ViCareSensorEntityDescription(
+            key="outside_temperature",
+            name="Outside Temperature",
+            value_getter=value_getter,
+        ),
+    )
+
+    coordinator._blocked_until = time.monotonic() + 60
+    sensor.update()
+    value_getter.assert_not_called()
+    assert sensor.native_value is None
+
+    coordinator._blocked_until = 0
+    sensor.update()
+    value_getter.assert_called_once_with(api)
+    assert sensor.native_value == 12.5
@@ -0,0 +1,33 @@
+"""Test the ViCare water heater entity."""
+from unittest.mock import MagicMock
+
+from homeassistant.components.vicare import ViCareDataUpdateCoordinator
+from homeassistant.components.vicare.water_heater import ViCareWater
+from homeassistant.const import ATTR_TEMPERATURE
+
+ENTITY_ID = "water_heater.vicare_water"
+
+
+async def test_set_temperature(hass):
+    """Test a new target temperature is shown right after it was set."""
+    api = MagicMock()
+    circuit = MagicMock(id="0")
+    device_config = MagicMock()
+    device_config.getConfig.return_value.serial = "1234"
+    device_config.getModel.return_value = "Vitodens 200"
+
+    coordinator = ViCareDataUpdateCoordinator(hass, api, [circuit], 60)
+    coordinator.data = {
+        circuit.id: {"mode": "dhwAndHeating", "circulation_pump_active": True},
+        "dhw": {"storage_temp": 50, "desired_temp": 55, "charging_active": False},
+    }
+
+    water = ViCareWater("ViCare Water", coordinator, api, circuit, device_config)
+    water.hass = hass
+    water.entity_id = ENTITY_ID
+    await water.async_added_to_hass()
+
+    await water.async_set_temperature(**{ATTR_TEMPERATURE: 60})
+
+    api.setDomesticHotWaterTemperature.assert_called_once_with(60)
+    assert hass.states.get(ENTITY_ID).attributes[ATTR_TEMPERATURE] == 60